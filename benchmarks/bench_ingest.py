@@ -0,0 +1,89 @@
+'''
+compares peak memory and throughput of loading the whole catalogue with pd.read_csv and parse_dates against the
+chunked ingestion of ingest.py. Every mode runs in a fresh interpreter so that peak RSS is measured on its own.
+
+Usage:
+python benchmarks/bench_ingest.py --repeat 40 --chunksize 100000
+'''
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+DATABASE = os.path.join(ROOT, 'data', 'database.csv')
+
+
+def make_csv(path: str, repeat: int):
+    '''
+    writes data/database.csv repeated repeat times to path
+    '''
+    with open(DATABASE) as database:
+        header = database.readline()
+        body = database.read()
+    with open(path, 'w') as enlarged:
+        enlarged.write(header)
+        for _ in range(repeat):
+            enlarged.write(body)
+
+
+def run_whole(path: str, output: str, chunksize: int) -> int:
+    from date_parsing import parse_dates
+    earthquakes = pd.read_csv(path, dtype={'Date': object})
+    earthquakes['date_parsed'] = parse_dates(earthquakes['Date'], dateonly=True, date_format='%m%d%Y')
+    earthquakes.to_csv(output, index=False)
+    return len(earthquakes)
+
+
+def run_stream(path: str, output: str, chunksize: int) -> int:
+    from ingest import ingest_csv
+    return ingest_csv(path, output, chunksize=chunksize)
+
+
+def measure(mode: str, path: str, chunksize: int) -> dict:
+    '''
+    runs one mode in a child interpreter and returns its rows, seconds and peak RSS
+    '''
+    result = subprocess.run([sys.executable, __file__, '--child', mode, '--path', path, '--chunksize', str(chunksize)],
+                            check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=40, help='copies of data/database.csv in the enlarged file')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--child', choices=['whole', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run = run_whole if args.child == 'whole' else run_stream
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            rows = run(args.path, os.path.join(tmp, 'output.csv'), args.chunksize)
+            seconds = time.perf_counter() - start
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(json.dumps({'rows': rows, 'seconds': seconds, 'peak_rss_mb': peak_mb}))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'database.csv')
+        make_csv(path, args.repeat)
+        print(f'{os.path.getsize(path) / 2**20:.0f} MB input, chunksize {args.chunksize}')
+        print(f'{"mode":>8} {"rows":>10} {"seconds":>9} {"rows/s":>11} {"peak RSS [MB]":>14}')
+        for mode in ['whole', 'stream']:
+            result = measure(mode, path, args.chunksize)
+            print(f'{mode:>8} {result["rows"]:>10} {result["seconds"]:>9.2f} '
+                  f'{result["rows"] / result["seconds"]:>11,.0f} {result["peak_rss_mb"]:>14.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+'''
+scaling of parse_dates(..., workers=N) on the Date column of data/database.csv repeated up to --rows rows
+
+Usage:
+python benchmarks/bench_parallel.py --rows 10000000 --workers 1 2 4 8 16
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import parse_dates
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    dates = pd.read_csv(DATABASE, usecols=['Date'], dtype={'Date': object})['Date'].to_numpy(dtype=object)
+    dates = pd.Series(np.tile(dates, -(-args.rows // len(dates)))[:args.rows], dtype=object)
+    print(f'{args.rows} rows on {os.cpu_count()} cpus')
+
+    print(f'{"workers":>8} {"seconds":>9} {"rows/s":>12} {"speedup":>8}')
+    expected, baseline = None, None
+    for workers in args.workers:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parsed = parse_dates(dates, dateonly=True, date_format='%m%d%Y', workers=workers)
+            timings.append(time.perf_counter() - start)
+        if expected is None:
+            expected, baseline = parsed, min(timings)
+        assert parsed.equals(expected)
+        print(f'{workers:>8} {min(timings):>9.2f} {args.rows / min(timings):>12,.0f} {baseline / min(timings):>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+'''
+benchmark harness for parse_dates on seeded synthetic catalogues: the Date column of data/database.csv is scaled to
+--rows rows and a set fraction of the rows is rewritten into ISO-8601, year-first, day-first, alternate separator or
+undelimited dates, optionally held as Arrow-backed string[pyarrow]. Every size runs in a fresh interpreter, checks the
+parsed dates against pandas' own parse of the catalogue and reports rows/s, the peak RSS added by the parse and the
+time per parse stage as JSON lines, which --compare checks against an earlier run.
+
+Usage:
+python benchmarks/bench_parse_dates.py --rows 1000000 10000000 --iso 0.01 --day-first 0.02 --output results.jsonl
+python benchmarks/bench_parse_dates.py --rows 1000000 --compare results.jsonl --tolerance 0.2
+python benchmarks/bench_parse_dates.py --rows 1000000 10000000 --iso 0.01 --arrow
+'''
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import parse_dates
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+# Layouts the dirty rows are rewritten into, by generator name
+DIRTY_FORMATS = {
+    'iso': '%Y-%m-%dT%H:%M:%S.000Z',
+    'year_first': '%Y/%m/%d',
+    'day_first': '%d/%m/%Y',
+    'alt_sep': '%m-%d-%Y',
+    'undelimited': '%m%d%Y',
+}
+
+
+def make_dirty_dates(rows: int, fractions: dict, seed: int = 0) -> tuple:
+    '''
+    scales the Date and Time columns of data/database.csv to rows rows and rewrites a fraction of them per layout
+
+    Arguments:
+    rows: int - number of rows.
+    fractions: dict - fraction of the rows per key of DIRTY_FORMATS, e.g. {'iso': 0.01}. The rewritten rows are
+                      disjoint, so the fractions must add up to at most 1.
+    seed: int - default value= 0. Seed of the rows chosen for every layout.
+
+    Returns:
+    tuple of pandas series of dtype object and numpy array of dtype datetime64 with the date of every row, NaT for
+    day-first rows which read as a valid month-first date as well.
+    '''
+    earthquakes = pd.read_csv(DATABASE, usecols=['Date', 'Time'], dtype=object)
+    timestamps = parse_dates(earthquakes['Date'], True, '%m%d%Y', time_obj_col=earthquakes['Time']).dt.tz_localize(None)
+    # Ground truth is parsed by pandas independently of parse_dates
+    truth = pd.to_datetime(earthquakes['Date'], format='mixed', utc=True).dt.tz_localize(None).dt.normalize()
+    base = np.arange(rows) % len(earthquakes)
+    dates = earthquakes['Date'].to_numpy(dtype=object)[base]
+
+    # Layout strings are formatted once per catalogue row and taken for the chosen rows
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(len(DIRTY_FORMATS) + 1, size=rows,
+                       p=[fractions.get(kind, 0.0) for kind in DIRTY_FORMATS] + [1 - sum(fractions.values())])
+    for kind, (name, layout) in enumerate(DIRTY_FORMATS.items()):
+        if fractions.get(name, 0.0) > 0:
+            rewritten = kinds == kind
+            dates[rewritten] = timestamps.dt.strftime(layout).to_numpy(dtype=object)[base[rewritten]]
+
+    expected = truth.to_numpy()[base]
+    if fractions.get('day_first', 0.0) > 0:
+        ambiguous = (kinds == list(DIRTY_FORMATS).index('day_first')) & (truth.dt.day.to_numpy()[base] <= 12)
+        expected[ambiguous] = np.datetime64('NaT')
+    return pd.Series(dates, dtype=object), expected
+
+
+def _rss_mb(field: str) -> float:
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+    raise ValueError(f'{field} not in /proc/self/status')
+
+
+def run(rows: int, fractions: dict, seed: int, unique: bool, arrow: bool = False) -> dict:
+    '''
+    parses one synthetic catalogue and returns the measurements of the run
+    '''
+    dates, expected = make_dirty_dates(rows, fractions, seed)
+    if arrow:
+        dates = dates.astype('string[pyarrow]')
+
+    # The peak RSS of generating the data is reset, so that the peak only covers the parse
+    gc.collect()
+    with open('/proc/self/clear_refs', 'w') as clear_refs:
+        clear_refs.write('5')
+    rss_before = _rss_mb('VmRSS')
+    start = time.perf_counter()
+    parsed, report = parse_dates(dates, dateonly=True, date_format='%m%d%Y', unique=unique, report=True)
+    seconds = time.perf_counter() - start
+    parse_rss = _rss_mb('VmHWM') - rss_before
+    if report.unparsed:
+        raise ValueError(f'parse_dates could not parse {report.unparsed} synthetic dates, e.g. {report.samples}')
+
+    checked = ~np.isnat(expected)
+    wrong = np.flatnonzero(checked & (parsed.to_numpy() != expected))
+    if len(wrong) > 0:
+        raise ValueError(f'parse_dates parsed {len(wrong)} synthetic dates wrongly, e.g. {dates.iloc[wrong[0]]} '
+                         f'into {parsed.iloc[wrong[0]]} instead of {pd.Timestamp(expected[wrong[0]])}')
+
+    return {
+        'rows': rows,
+        'fractions': fractions,
+        'seed': seed,
+        'unique': unique,
+        'arrow': arrow,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds,
+        'parse_rss_mb': parse_rss,
+        'checked': int(checked.sum()),
+        'stages': report.timings,
+        'repaired': report.repaired,
+    }
+
+
+def _run_key(result: dict) -> tuple:
+    # Results written before --arrow existed were object dtype runs
+    return result['rows'], json.dumps(result['fractions'], sort_keys=True), result['unique'], result.get('arrow', False)
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    '''
+    returns a message for every run whose rows/s dropped by more than tolerance against the same run in the baseline
+    '''
+    baseline = {}
+    with open(baseline_path) as baseline_file:
+        for line in baseline_file:
+            result = json.loads(line)
+            baseline[_run_key(result)] = result
+    regressions = []
+    for result in results:
+        previous = baseline.get(_run_key(result))
+        if previous is not None and result['rows_per_sec'] < (1 - tolerance) * previous['rows_per_sec']:
+            regressions.append(f'{result["rows"]} rows: {result["rows_per_sec"]:,.0f} rows/s, '
+                               f'baseline {previous["rows_per_sec"]:,.0f} rows/s')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000])
+    for name in DIRTY_FORMATS:
+        parser.add_argument(f'--{name.replace("_", "-")}', type=float, default=0.0, help=f'fraction of {name} rows')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--unique', action='store_true', help='parse with unique=True')
+    parser.add_argument('--arrow', action='store_true', help='parse a string[pyarrow] column instead of dtype object')
+    parser.add_argument('--output', help='JSON lines file the results are written to')
+    parser.add_argument('--compare', help='JSON lines file of an earlier run to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed drop of rows/s against --compare')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    fractions = {name: getattr(args, name) for name in DIRTY_FORMATS if getattr(args, name) > 0}
+
+    if args.child is not None:
+        print(json.dumps(run(args.child, fractions, args.seed, args.unique, args.arrow)))
+        return
+
+    results = []
+    for rows in args.rows:
+        child = [sys.executable, __file__, '--child', str(rows), '--seed', str(args.seed)]
+        child += [f'--{name.replace("_", "-")}={fraction}' for name, fraction in fractions.items()]
+        child += ['--unique'] if args.unique else []
+        child += ['--arrow'] if args.arrow else []
+        output = subprocess.run(child, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        stages = ' '.join(f'{stage}={seconds:.3f}' for stage, seconds in result['stages'].items())
+        print(f'{rows} rows: {result["rows_per_sec"]:,.0f} rows/s, parse peak RSS +{result["parse_rss_mb"]:.0f} MB, {stages}',
+              file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.writelines(json.dumps(result) + '\n' for result in results)
+    else:
+        for result in results:
+            print(json.dumps(result))
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for regression in regressions:
+            print(f'regression: {regression}', file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
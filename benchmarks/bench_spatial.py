@@ -0,0 +1,72 @@
+'''
+compares bounding-box and radius queries of SpatialIndex with boolean masks over the whole catalogue
+
+Usage:
+python benchmarks/bench_spatial.py --queries 100000 --repeat 1
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from catalogue import load_catalogue
+from spatial_index import SpatialIndex, haversine_km
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+
+def random_regions(queries: int, seed: int = 0) -> tuple:
+    '''
+    returns random boxes of up to 20 x 20 degrees and random circles of up to 1000 km
+    '''
+    rng = np.random.default_rng(seed)
+    min_lat = rng.uniform(-90, 70, queries)
+    min_lon = rng.uniform(-180, 160, queries)
+    boxes = np.column_stack([min_lat, min_lat + rng.uniform(0, 20, queries),
+                             min_lon, min_lon + rng.uniform(0, 20, queries)])
+    circles = np.column_stack([rng.uniform(-80, 80, queries), rng.uniform(-180, 180, queries),
+                               rng.uniform(10, 1000, queries)])
+    return boxes, circles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=1, help='copies of the catalogue to index')
+    parser.add_argument('--cell-size', type=float, default=1.0)
+    args = parser.parse_args()
+
+    earthquakes = load_catalogue(DATABASE)
+    if args.repeat > 1:
+        earthquakes = pd.concat([earthquakes] * args.repeat, ignore_index=True)
+    lat = earthquakes['Latitude'].to_numpy(dtype=np.float64)
+    lon = earthquakes['Longitude'].to_numpy(dtype=np.float64)
+
+    start = time.perf_counter()
+    index = SpatialIndex.from_frame(earthquakes, cell_size=args.cell_size)
+    print(f'{len(earthquakes)} events, index built in {time.perf_counter() - start:.3f} s')
+
+    boxes, circles = random_regions(args.queries)
+    queries = {
+        'bbox mask': lambda: [np.flatnonzero((lat >= a) & (lat <= b) & (lon >= c) & (lon <= d)) for a, b, c, d in boxes],
+        'bbox index': lambda: [index.bbox(a, b, c, d) for a, b, c, d in boxes],
+        'radius mask': lambda: [np.flatnonzero(haversine_km(lat, lon, a, b) <= r) for a, b, r in circles],
+        'radius index': lambda: [index.radius(a, b, r) for a, b, r in circles],
+    }
+    print(f'{"query":>14} {"seconds":>9} {"queries/s":>11}')
+    results = {}
+    for query, func in queries.items():
+        start = time.perf_counter()
+        results[query] = func()
+        seconds = time.perf_counter() - start
+        print(f'{query:>14} {seconds:>9.2f} {args.queries / seconds:>11,.0f}')
+    for kind in ['bbox', 'radius']:
+        assert all(np.array_equal(a, b) for a, b in zip(results[f'{kind} mask'], results[f'{kind} index']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+'''
+compares the single pass time suffix stripper of parse_dates with the previous chain of str.replace calls
+
+Usage:
+python benchmarks/bench_strip_time_suffix.py --rows 100000 1000000 10000000 --iso-fraction 0.05
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import _strip_time_suffix
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+
+def strip_time_suffix_chain(date_col: pd.Series) -> pd.Series:
+    '''
+    time suffix removal of parse_dates before it was replaced by _strip_time_suffix
+    '''
+    indices = date_col.str.len() > 10
+    if indices.any():
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3}Z', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3}', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}:[0-9]{2}:[0-9]{2}', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}[0-9]{2}[0-9]{2}', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}[0-9]{2}[0-9]{2}.[0-9]{3}Z', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}[0-9]{2}[0-9]{2}.[0-9]{3}', '', regex=True)
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}:[0-9]{2}:[0-9]{2} [AaPp][Mm]', '')
+        date_col[indices] = date_col[indices].str.replace(r'[T\s][0-9]{2}:[0-9]{2} [AaPp][Mm]', '')
+    return date_col
+
+
+def make_dates(rows: int, iso_fraction: float, seed: int = 0) -> pd.Series:
+    '''
+    repeats the Date column of data/database.csv up to rows and turns iso_fraction of them into ISO-8601 timestamps
+    '''
+    earthquakes = pd.read_csv(DATABASE, usecols=['Date', 'Time'])
+    repeats = -(-rows // len(earthquakes))
+    dates = pd.Series(np.tile(earthquakes['Date'].to_numpy(dtype=object), repeats)[:rows], dtype=object)
+    if iso_fraction > 0:
+        rng = np.random.default_rng(seed)
+        iso = rng.random(rows) < iso_fraction
+        dates[iso] = '1975-02-23T02:58:41.000Z'
+    return dates
+
+
+def best_of(func, dates: pd.Series, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        date_col = dates.copy()
+        start = time.perf_counter()
+        func(date_col)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[23412, 1_000_000, 10_000_000])
+    parser.add_argument('--iso-fraction', type=float, default=0.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"rows":>12} {"chain [s]":>12} {"single [s]":>12} {"speedup":>8}')
+    for rows in args.rows:
+        dates = make_dates(rows, args.iso_fraction)
+        assert strip_time_suffix_chain(dates.copy()).equals(_strip_time_suffix(dates.copy()))
+        chain = best_of(strip_time_suffix_chain, dates, args.repeat)
+        single = best_of(_strip_time_suffix, dates, args.repeat)
+        print(f'{rows:>12} {chain:>12.4f} {single:>12.4f} {chain / single:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+'''
+compares parse_dates(..., time_obj_col=Time) with the naive pd.to_datetime(Date + ' ' + Time) on data/database.csv
+repeated up to --rows rows
+
+Usage:
+python benchmarks/bench_timestamps.py --rows 1000000 10000000
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import parse_dates
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+
+def naive(dates: pd.Series, times: pd.Series, **kwargs) -> pd.Series:
+    return pd.to_datetime(dates + ' ' + times, utc=True, errors='coerce', **kwargs)
+
+
+def best_of(func, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[23412, 1_000_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    earthquakes = pd.read_csv(DATABASE, usecols=['Date', 'Time'], dtype=object)
+    print(f'{"rows":>10} {"method":>24} {"seconds":>9} {"rows/s":>12} {"NaT":>6}')
+    for rows in args.rows:
+        repeats = -(-rows // len(earthquakes))
+        dates = pd.Series(np.tile(earthquakes['Date'].to_numpy(dtype=object), repeats)[:rows], dtype=object)
+        times = pd.Series(np.tile(earthquakes['Time'].to_numpy(dtype=object), repeats)[:rows], dtype=object)
+        methods = {
+            'naive': lambda: naive(dates, times),
+            "naive format='mixed'": lambda: naive(dates, times, format='mixed'),
+            'parse_dates': lambda: parse_dates(dates, True, '%m%d%Y', time_obj_col=times),
+            'parse_dates unique': lambda: parse_dates(dates, True, '%m%d%Y', unique=True, time_obj_col=times),
+        }
+        for method, func in methods.items():
+            seconds, result = best_of(func, args.repeat)
+            print(f'{rows:>10} {method:>24} {seconds:>9.3f} {rows / seconds:>12,.0f} {result.isna().sum():>6}')
+
+
+if __name__ == '__main__':
+    main()
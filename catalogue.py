@@ -0,0 +1,198 @@
+'''
+typed, compact loading of the earthquake catalogue with a cached Parquet sidecar next to the CSV file
+
+Usage:
+python catalogue.py data/database.csv
+'''
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from date_parsing import parse_dates
+
+# Measurements are stored as float32 and the low-cardinality text columns as categoricals
+CATALOGUE_DTYPES = {
+    'Latitude': 'float32',
+    'Longitude': 'float32',
+    'Depth': 'float32',
+    'Depth Error': 'float32',
+    'Depth Seismic Stations': 'float32',
+    'Magnitude': 'float32',
+    'Magnitude Error': 'float32',
+    'Magnitude Seismic Stations': 'float32',
+    'Azimuthal Gap': 'float32',
+    'Horizontal Distance': 'float32',
+    'Horizontal Error': 'float32',
+    'Root Mean Square': 'float32',
+    'Type': 'category',
+    'Magnitude Type': 'category',
+    'Source': 'category',
+    'Location Source': 'category',
+    'Magnitude Source': 'category',
+    'Status': 'category',
+    'Date': object,
+    'Time': object,
+    'ID': object,
+}
+
+_SOURCE_METADATA_KEY = b'catalogue_source'
+# Bumped whenever the layout of the typed frame changes, so that older sidecars are rebuilt
+_SIDECAR_VERSION = 2
+
+
+def combine_date_time(date_col: pd.Series, time_col: pd.Series) -> pd.Series:
+    '''
+    combines the Date and Time columns of the catalogue into one UTC timestamp column
+
+    Arguments:
+    date_col: pandas series - Date column, e.g. '01/02/1965' or '1975-02-23T02:58:41.000Z'.
+    time_col: pandas series - Time column, e.g. '13:44:18' or '1975-02-23T02:58:41.000Z'.
+
+    Returns:
+    pandas series of dtype datetime64[ns, UTC].
+    Raises ValueError if the dates or times can not be parsed.
+    '''
+    timestamps = parse_dates(date_col, dateonly=True, date_format='%m%d%Y', unique=True, time_obj_col=time_col)
+    if timestamps is None:
+        raise ValueError('Date and Time columns could not be parsed')
+    return timestamps
+
+
+def read_catalogue_csv(path: str) -> pd.DataFrame:
+    '''
+    reads the catalogue CSV file with CATALOGUE_DTYPES and replaces Date and Time by a UTC timestamp column date_parsed
+
+    Arguments:
+    path: str - path of the CSV file, e.g. './data/database.csv'.
+
+    Returns:
+    pandas dataframe.
+    '''
+    earthquakes = pd.read_csv(path, dtype=CATALOGUE_DTYPES)
+    date_parsed = combine_date_time(earthquakes['Date'], earthquakes['Time'])
+    earthquakes = earthquakes.drop(columns=['Date', 'Time'])
+    earthquakes.insert(0, 'date_parsed', date_parsed)
+    return earthquakes
+
+
+def _file_hash(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _sidecar_is_fresh(sidecar: str, source: dict, path: str) -> bool:
+    '''
+    checks the source file recorded in the sidecar against the CSV file, by mtime and size first and by hash otherwise
+    '''
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(sidecar).metadata or {}
+    if _SOURCE_METADATA_KEY not in metadata:
+        return False
+    cached = json.loads(metadata[_SOURCE_METADATA_KEY])
+    if cached.get('version') != _SIDECAR_VERSION:
+        return False
+    if cached['mtime_ns'] == source['mtime_ns'] and cached['size'] == source['size']:
+        return True
+    return cached['size'] == source['size'] and cached['sha256'] == _file_hash(path)
+
+
+def _write_sidecar(table, source: dict, sidecar: str):
+    '''
+    writes the typed table to the sidecar with the source file recorded in its schema metadata
+    '''
+    import pyarrow.parquet as pq
+
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SOURCE_METADATA_KEY: json.dumps(source)})
+    # Written next to the sidecar first, so that an interrupted write never leaves a broken sidecar behind
+    pq.write_table(table, sidecar + '.tmp')
+    os.replace(sidecar + '.tmp', sidecar)
+
+
+def load_catalogue(path: str = './data/database.csv', use_cache: bool = True, sidecar: str = None) -> pd.DataFrame:
+    '''
+    loads the typed catalogue from a Parquet sidecar if it is up to date, otherwise from the CSV file
+
+    The sidecar is rebuilt when it was written by an older version of this loader, or whenever the mtime or size of
+    the CSV file differs from the one recorded in it and the sha256 hash of the CSV file changed as well. If only the
+    mtime changed, e.g. after a touch, then the new mtime is recorded in the sidecar so that later loads skip the
+    hash. Without pyarrow the CSV file is always read.
+
+    Arguments:
+    path: str - default value= './data/database.csv'. Path of the CSV file.
+    use_cache: bool - default value= True. if False, then the sidecar is neither read nor written.
+    sidecar: str - default value= None. Path of the Parquet sidecar, by default the CSV path with suffix .parquet.
+
+    Returns:
+    pandas dataframe with columns typed as in CATALOGUE_DTYPES and a datetime64[ns, UTC] column date_parsed.
+    '''
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        use_cache = False
+    if not use_cache:
+        return read_catalogue_csv(path)
+
+    sidecar = sidecar or os.path.splitext(path)[0] + '.parquet'
+    stat = os.stat(path)
+    source = {'version': _SIDECAR_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+    if os.path.exists(sidecar) and _sidecar_is_fresh(sidecar, source, path):
+        table = pq.read_table(sidecar)
+        cached = json.loads(table.schema.metadata[_SOURCE_METADATA_KEY])
+        if cached['mtime_ns'] != source['mtime_ns']:
+            _write_sidecar(table, {**cached, 'mtime_ns': source['mtime_ns']}, sidecar)
+        return table.to_pandas()
+
+    earthquakes = read_catalogue_csv(path)
+    source['sha256'] = _file_hash(path)
+    _write_sidecar(pa.Table.from_pandas(earthquakes, preserve_index=False), source, sidecar)
+    return earthquakes
+
+
+def memory_report(untyped: pd.DataFrame, typed: pd.DataFrame) -> pd.DataFrame:
+    '''
+    compares the memory usage per column of the plain pd.read_csv frame with the typed catalogue
+
+    Arguments:
+    untyped: pandas dataframe - e.g. pd.read_csv('./data/database.csv').
+    typed: pandas dataframe - e.g. load_catalogue('./data/database.csv').
+
+    Returns:
+    pandas dataframe with the bytes used before and after per column and a total row.
+    '''
+    columns = list(untyped.columns) + [column for column in typed.columns if column not in untyped.columns]
+    report = pd.DataFrame({'before': untyped.memory_usage(index=False, deep=True),
+                           'after': typed.memory_usage(index=False, deep=True)}).reindex(columns)
+    report.loc['total'] = report.sum()
+    report['ratio'] = report['after'] / report['before']
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', nargs='?', default='./data/database.csv')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    untyped = pd.read_csv(args.path)
+    print(f'pd.read_csv: {time.perf_counter() - start:.3f} s')
+    for attempt in ['load_catalogue (first call)', 'load_catalogue (second call)']:
+        start = time.perf_counter()
+        typed = load_catalogue(args.path)
+        print(f'{attempt}: {time.perf_counter() - start:.3f} s')
+
+    report = memory_report(untyped, typed)
+    with pd.option_context('display.float_format', '{:,.2f}'.format, 'display.max_rows', None):
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
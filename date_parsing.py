@@ -0,0 +1,726 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import re
+import time
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_object_dtype
+
+
+# Time parts which dateonly=True removes from the date, e.g. 'T02:58:41.000Z', ' 02:58:41', 'T025841'
+# or ' 02:58 PM'. Longer alternatives come first so that a single pass removes the whole time part.
+_TIME_SUFFIX = re.compile(r'[T\s](?:[0-9]{2}:[0-9]{2}(?::[0-9]{2})? [AaPp][Mm]'
+                          r'|[0-9]{2}:[0-9]{2}:[0-9]{2}(?:.[0-9]{3}Z?)?'
+                          r'|[0-9]{6}(?:.[0-9]{3}Z?)?)')
+
+
+def _strip_time_suffix(date_col: pd.Series) -> pd.Series:
+    '''
+    removes the time part from dates longer than 10 characters with one precompiled regex pass
+
+    Arguments:
+    date_col: pandas series - column of dtype object containing date strings.
+
+    Returns:
+    pandas series of dtype object with only the date part of every string.
+    '''
+    long_dates = date_col.str.len() > 10
+    if long_dates.any():
+        date_col[long_dates] = date_col[long_dates].str.replace(_TIME_SUFFIX, '', regex=True)
+    return date_col
+
+
+# Layout of the ISO-8601 timestamps in the catalogue, e.g. '1975-02-23T02:58:41.000Z'
+_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+_ISO_SHAPE = 'dddd-dd-ddTdd:dd:dd.dddZ'
+_DIGITS_TO_SHAPE = str.maketrans('0123456789', 'dddddddddd')
+
+# Stages of _parse_date_values in the order they run
+_STAGES = ('layout_detect', 'layout_parse', 'suffix_strip', 'separator_normalize', 'strict_parse', 'nat_repair')
+
+# How parse_dates resolved a row, see ParseReport
+_STRICT, _REPAIRED, _UNPARSED, _CACHED = 0, 1, 2, 3
+
+# Partitions for worker processes are sent as NUL separated utf-8 bytes and hold at least _MIN_PARTITION_ROWS rows
+_PARTITION_SEP = '\x00'
+_MIN_PARTITION_ROWS = 50_000
+
+
+def _layout_format(shape: str, date_format: str):
+    '''
+    returns the exact strftime format of a date layout or None if the layout has to be repaired
+
+    Arguments:
+    shape: str - date string with every digit replaced by 'd', e.g. 'dd/dd/dddd'.
+    date_format: str - one of the six supported date formats of parse_dates.
+
+    Returns:
+    str - format for pd.to_datetime, or None.
+    '''
+    if shape == _ISO_SHAPE:
+        return _ISO_FORMAT
+
+    directives = [date_format[:2], date_format[2:4], date_format[4:6]]
+    widths = [4 if directive == '%Y' else 2 for directive in directives]
+    if shape == 'd' * sum(widths):
+        # Undelimited dates like DDMMYY or MMDDYYYY
+        return date_format
+    for layout_directives, layout_widths in [(directives, widths), (['%Y', '%m', '%d'], [4, 2, 2])]:
+        if len(shape) == sum(layout_widths) + 2:
+            layout_sep = shape[layout_widths[0]]
+            if layout_sep in '/-.' and shape == layout_sep.join('d' * width for width in layout_widths):
+                return layout_sep.join(layout_directives)
+    return None
+
+
+def _detect_layouts(date_col: pd.Series, date_format: str) -> dict:
+    '''
+    sorts rows into layout buckets by the position of their digits and separators in one classification pass
+
+    Arguments:
+    date_col: pandas series - column of dtype object containing date strings.
+    date_format: str - one of the six supported date formats of parse_dates.
+
+    Returns:
+    dict - exact format of every known layout mapped to the numpy array of row positions in that layout.
+    '''
+    # Shapes are computed for the distinct values only and broadcast back through the factorize codes
+    value_codes, values = pd.factorize(date_col)
+    shapes = pd.Series(values, dtype=object).str.translate(_DIGITS_TO_SHAPE)
+    layout_formats = [_layout_format(shape, date_format) if isinstance(shape, str) else None for shape in shapes]
+    layout_codes, formats = pd.factorize(pd.Series(layout_formats, dtype=object))
+    row_layouts = np.where(value_codes >= 0, layout_codes[value_codes], -1) if len(values) > 0 else value_codes
+
+    layouts = {}
+    for code, layout_format in enumerate(formats):
+        layouts[layout_format] = np.flatnonzero(row_layouts == code)
+    return layouts
+
+
+def _normalize_separators(date_col: pd.Series, sep: str) -> pd.Series:
+    '''
+    replaces the separators '/', '-' and '.' with sep in a single pass
+
+    Arguments:
+    date_col: pandas series - column of dtype object containing date strings.
+    sep: str - separator used between date components.
+
+    Returns:
+    pandas series of dtype object.
+    '''
+    if sep in ['/', '-', '.']:
+        return date_col.str.replace(r'[/\-.]', sep, regex=True)
+    return date_col
+
+
+def _valid_year(year: np.ndarray, width: np.ndarray) -> np.ndarray:
+    '''
+    returns boolean mask of year components which are acceptable for repairing NaT dates
+
+    Arguments:
+    year: numpy array - integer year components.
+    width: numpy array - number of digits of each year component (2 or 4).
+
+    Returns:
+    numpy array of dtype bool.
+    '''
+    this_year = date.today().year
+    return ((width == 2) & (year >= 0) & (year <= this_year % 100)) | \
+           ((width == 4) & (year >= 1945) & (year <= this_year))
+
+
+def _repair_nat_dates(date_col_nat: pd.Series, date_format: str, sep: str, errors: str = 'raise') -> pd.Series:
+    '''
+    rearranges dates which could not be parsed with date_format into datetime64 in one columnar pass
+
+    Every row is split into three integer components with a single str.extract, rows with any other characters
+    are not repaired. The layout of each row (year-first, month-first or day-first) is selected with numpy masks
+    and all repaired rows are assembled at once with pd.to_datetime from year/month/day components.
+
+    Arguments:
+    date_col_nat: pandas series - rows of the separator normalized column which are NaT after strict parsing.
+    date_format: str - one of the six supported date formats of parse_dates.
+    sep: str - separator used between date components.
+    errors: str - default value= 'raise'. if 'coerce', then rows which can not be repaired are NaT instead.
+
+    Returns:
+    pandas series of dtype datetime64 with the same index as date_col_nat.
+    Raises ValueError if any row is not in any of the specified datetime format and errors='raise'.
+    '''
+    if sep in ['', None] and errors == 'coerce':
+        return pd.Series(np.datetime64('NaT'), index=date_col_nat.index, dtype='datetime64[ns]')
+    if sep in ['', None]:
+        raise ValueError(f'{date_col_nat.iloc[0]} at index {date_col_nat.index[0]} is not in any of the specified datetime format')
+
+    parts = date_col_nat.str.extract(rf'^(\d{{4}}|\d{{2}}){re.escape(sep)}(\d{{2}}){re.escape(sep)}(\d{{4}}|\d{{2}})$')
+    matched = parts.notna().all(axis=1).to_numpy()
+    first, second, third = (parts[i].fillna('-1').astype(np.int64).to_numpy() for i in range(3))
+    first_width = parts[0].str.len().to_numpy(dtype=np.int64, na_value=0)
+    third_width = parts[2].str.len().to_numpy(dtype=np.int64, na_value=0)
+
+    # Layouts are tried in the order year-first, month-first, day-first and every row takes the first
+    # layout whose components all fit
+    year_first = matched & _valid_year(first, first_width) & (third_width == 2) & \
+                 (second >= 1) & (second <= 12) & (third >= 1) & (third <= 31)
+    month_first = matched & ~year_first & (first_width == 2) & (first >= 1) & (first <= 12) & \
+                  (second >= 1) & (second <= 31) & _valid_year(third, third_width)
+    day_first = matched & ~year_first & ~month_first & (first_width == 2) & (first >= 1) & (first <= 31) & \
+                (second >= 1) & (second <= 12) & _valid_year(third, third_width)
+    repaired = year_first | month_first | day_first
+
+    year = np.where(year_first, first, third)
+    year_width = np.where(year_first, first_width, third_width)
+    month = np.where(year_first, second, np.where(month_first, first, second))
+    day = np.where(year_first, third, np.where(month_first, second, first))
+
+    # 4 digit years are taken as they are, like in the layout stage. 2 digit years get strptime's %y century
+    # (1969-2068) for 2 digit target formats and 1946-2045 otherwise
+    if '%y' in date_format:
+        century = np.where(year < 69, 2000, 1900)
+    else:
+        century = np.where(year > 45, 1900, 2000)
+    year = np.where(year_width == 2, century + year, year)
+
+    components = pd.DataFrame({'year': year, 'month': month, 'day': day})[repaired]
+    repaired_dates = pd.Series(np.datetime64('NaT'), index=date_col_nat.index, dtype='datetime64[ns]')
+    # The masks only bound the day by 31, days past the end of their month like 02/30 are NaT here
+    repaired_dates[repaired] = pd.to_datetime(components, errors='coerce').to_numpy()
+    repaired = repaired_dates.notna().to_numpy()
+
+    if not repaired.all() and errors != 'coerce':
+        bad = np.flatnonzero(~repaired)[0]
+        raise ValueError(f'{date_col_nat.iloc[bad]} at index {date_col_nat.index[bad]} is not in any of the specified datetime format')
+    return repaired_dates
+
+
+class DateCache:
+    '''
+    bounded LRU cache of date strings mapped to their parsed datetime64 values, shared across parse_dates calls
+
+    Arguments:
+    maxsize: int - default value= 100000. Maximum number of cached date strings, least recently used are evicted first.
+
+    Attributes:
+    hits: int - number of distinct date strings found in the cache.
+    misses: int - number of distinct date strings which had to be parsed.
+    '''
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def lookup(self, values: np.ndarray, settings: tuple) -> tuple:
+        '''
+        looks up date strings parsed with the given parse_dates settings
+
+        Arguments:
+        values: numpy array - distinct date strings.
+        settings: tuple - (dateonly, date_format, sep) of the parse_dates call.
+
+        Returns:
+        tuple of numpy array of dtype datetime64 and numpy array of dtype bool marking the values not in the cache.
+        '''
+        parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+        missing = np.ones(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            key = (settings, value)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                parsed[i] = self._cache[key]
+                missing[i] = False
+        self.hits += int((~missing).sum())
+        self.misses += int(missing.sum())
+        return parsed, missing
+
+    def update(self, values: np.ndarray, parsed: np.ndarray, settings: tuple):
+        '''
+        stores parsed date strings and evicts the least recently used ones beyond maxsize
+
+        Arguments:
+        values: numpy array - date strings.
+        parsed: numpy array - datetime64 values of the date strings.
+        settings: tuple - (dateonly, date_format, sep) of the parse_dates call.
+        '''
+        for value, parsed_value in zip(values, parsed):
+            self._cache[(settings, value)] = parsed_value
+            self._cache.move_to_end((settings, value))
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'currsize': len(self._cache)}
+
+
+# Default cache for parse_dates(..., cache=date_cache)
+date_cache = DateCache()
+
+
+class _StageTimer:
+    '''
+    adds the seconds spent in a stage to timings[stage] whenever the stage ends, a stage starts when the previous ends
+
+    Arguments:
+    timings: dict - seconds per stage, added to by every call of end.
+    '''
+    def __init__(self, timings: dict):
+        self.timings = timings
+        self.stage_start = time.perf_counter()
+
+    def end(self, stage: str):
+        now = time.perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.0) + now - self.stage_start
+        self.stage_start = now
+
+
+def _parse_date_values(date_col: pd.Series, dateonly: bool, date_format: str, sep: str, timings: dict = None,
+                       errors: str = 'raise', status: np.ndarray = None) -> np.ndarray:
+    '''
+    parses a column of date strings, raises ValueError if a date is not in any of the specified datetime format
+
+    Arguments:
+    date_col: pandas series - column of dtype object containing date strings.
+    dateonly, date_format, sep - as in parse_dates.
+    timings: dict - default value= None. if given, then the seconds spent in every stage are added to it under the keys
+                    of _STAGES.
+    errors: str - default value= 'raise'. if 'coerce', then dates which can not be parsed are NaT instead.
+    status: numpy array - default value= None. if given, then it is filled with how every row was resolved,
+                          _STRICT, _REPAIRED or _UNPARSED.
+
+    Returns:
+    numpy array of dtype datetime64.
+    '''
+    end_stage = _StageTimer({} if timings is None else timings).end
+
+    date_values = np.full(len(date_col), np.datetime64('NaT'), dtype='datetime64[ns]')
+    unparsed = np.ones(len(date_col), dtype=bool)
+    if status is not None:
+        status[:] = _STRICT
+
+    # Rows whose layout is known are parsed with one exact format per layout
+    layouts = _detect_layouts(date_col, date_format)
+    end_stage('layout_detect')
+    for layout_format, positions in layouts.items():
+        parsed = pd.to_datetime(date_col.iloc[positions], format=layout_format, errors='coerce')
+        if dateonly is True and layout_format == _ISO_FORMAT:
+            parsed = parsed.dt.normalize()
+        parsed_rows = parsed.notna().to_numpy()
+        date_values[positions[parsed_rows]] = parsed.to_numpy()[parsed_rows]
+        unparsed[positions[parsed_rows]] = False
+    end_stage('layout_parse')
+
+    # Remaining rows are brought into date_format with sep and repaired if that still fails
+    if unparsed.any():
+        date_col_copy = date_col[unparsed]
+        if dateonly is True:
+            date_col_copy = _strip_time_suffix(date_col_copy)
+        end_stage('suffix_strip')
+        date_col_copy = _normalize_separators(date_col_copy, sep)
+        end_stage('separator_normalize')
+
+        date_col_copy_final = pd.to_datetime(date_col_copy, format=date_format[:2]+sep+date_format[2:4]+sep+date_format[4:6],errors='coerce')
+        end_stage('strict_parse')
+        if(date_col_copy_final.isna().any()):
+            # To try to rearrange the NaT dates as per date_format
+            nat_condition = date_col_copy_final.isna()
+            date_col_copy_final[nat_condition] = _repair_nat_dates(date_col_copy[nat_condition], date_format, sep, errors)
+            if status is not None:
+                repaired_rows = np.flatnonzero(unparsed)[nat_condition.to_numpy()]
+                status[repaired_rows] = np.where(date_col_copy_final[nat_condition].isna(), _UNPARSED, _REPAIRED)
+        date_values[unparsed] = date_col_copy_final.to_numpy()
+        end_stage('nat_repair')
+
+    return date_values
+
+
+def _parse_partition(data: bytes, missing: np.ndarray, index: pd.Index, dateonly: bool, date_format: str, sep: str,
+                     errors: str = 'raise') -> tuple:
+    '''
+    parses one partition of a column in a worker process
+
+    Arguments:
+    data: bytes - utf-8 encoded date strings of the partition joined by NUL characters.
+    missing: numpy array - boolean mask of the rows which were not strings.
+    index: pandas index - index labels of the partition, used in error messages.
+    dateonly, date_format, sep - as in parse_dates.
+    errors: str - default value= 'raise'. As in _parse_date_values.
+
+    Returns:
+    tuple of numpy array of dtype datetime64, status of every row and dict of seconds per stage.
+    '''
+    date_col = pd.Series(data.decode('utf-8').split(_PARTITION_SEP), index=index, dtype=object)
+    date_col[missing] = np.nan
+    timings = {}
+    status = np.empty(len(date_col), dtype=np.int8)
+    return _parse_date_values(date_col, dateonly, date_format, sep, timings, errors, status), status, timings
+
+
+def _parse_date_values_parallel(date_col: pd.Series, dateonly: bool, date_format: str, sep: str, workers: int,
+                                timings: dict = None, errors: str = 'raise', status: np.ndarray = None) -> np.ndarray:
+    '''
+    splits a column into contiguous partitions and parses them in a ProcessPoolExecutor
+
+    Every partition is sent to its worker as a single bytes object instead of a pickled object Series, and the
+    results are concatenated back in index order.
+
+    Arguments:
+    date_col: pandas series - column of dtype object containing date strings.
+    dateonly, date_format, sep - as in parse_dates.
+    workers: int - number of worker processes.
+    timings, errors, status - as in _parse_date_values. Stage timings are summed over the workers.
+
+    Returns:
+    numpy array of dtype datetime64.
+    '''
+    partitions = min(workers, -(-len(date_col) // _MIN_PARTITION_ROWS))
+    if partitions <= 1:
+        return _parse_date_values(date_col, dateonly, date_format, sep, timings, errors, status)
+
+    values = date_col.to_numpy(dtype=object)
+    bounds = np.linspace(0, len(values), partitions + 1).astype(np.int64)
+    missing = np.fromiter((not isinstance(value, str) for value in values), dtype=bool, count=len(values))
+    if missing.any():
+        values = np.where(missing, '', values)
+
+    with ProcessPoolExecutor(max_workers=partitions) as executor:
+        futures = [executor.submit(_parse_partition, _PARTITION_SEP.join(values[start:stop]).encode('utf-8'),
+                                   missing[start:stop], date_col.index[start:stop], dateonly, date_format, sep, errors)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        results = [future.result() for future in futures]
+
+    for _, partition_status, partition_timings in results:
+        if timings is not None:
+            for stage, seconds in partition_timings.items():
+                timings[stage] = timings.get(stage, 0.0) + seconds
+    if status is not None:
+        status[:] = np.concatenate([partition_status for _, partition_status, _ in results])
+    return np.concatenate([date_values for date_values, _, _ in results])
+
+
+def _parse_unique_dates(date_col: pd.Series, dateonly: bool, date_format: str, sep: str, cache: DateCache = None,
+                        workers: int = None, timings: dict = None, errors: str = 'raise',
+                        status: np.ndarray = None) -> np.ndarray:
+    '''
+    parses only the distinct values of a column, or the categories of a categorical column, and maps them back to the rows
+
+    Arguments:
+    date_col: pandas series - column of dtype object or categorical with string categories.
+    dateonly, date_format, sep - as in parse_dates.
+    cache: DateCache - default value= None. Cache looked up before and updated after parsing the distinct values.
+                       Dates which could not be parsed are not cached.
+    workers: int - default value= None. Number of worker processes parsing the distinct values.
+    timings, errors, status - as in _parse_date_values. Rows whose value came from the cache get the status _CACHED.
+
+    Returns:
+    numpy array of dtype datetime64.
+    '''
+    if isinstance(date_col.dtype, pd.CategoricalDtype):
+        codes = date_col.cat.codes.to_numpy().astype(np.int64)
+        values = date_col.cat.categories.to_numpy(dtype=object)
+    else:
+        codes, values = pd.factorize(date_col)
+        values = np.asarray(values, dtype=object)
+
+    # Missing values get a code of their own so that they are reported like in the row by row parse
+    if (codes == -1).any():
+        codes = np.where(codes == -1, len(values), codes)
+        values = np.append(values, np.nan)
+
+    # Only used values are parsed, labelled with the index of their first row for error messages
+    first_rows = pd.Series(codes).drop_duplicates()
+    used_codes = first_rows.to_numpy()
+    used_values = values[used_codes]
+
+    settings = (dateonly, date_format, sep)
+    if cache is not None:
+        parsed, missing = cache.lookup(used_values, settings)
+    else:
+        parsed = np.full(len(used_values), np.datetime64('NaT'), dtype='datetime64[ns]')
+        missing = np.ones(len(used_values), dtype=bool)
+    used_status = np.full(len(used_values), _CACHED, dtype=np.int8)
+    if missing.any():
+        missing_values = pd.Series(used_values[missing], index=date_col.index[first_rows.index[missing]], dtype=object)
+        missing_status = np.empty(missing.sum(), dtype=np.int8)
+        if workers is not None and workers > 1:
+            parsed[missing] = _parse_date_values_parallel(missing_values, dateonly, date_format, sep, workers, timings,
+                                                          errors, missing_status)
+        else:
+            parsed[missing] = _parse_date_values(missing_values, dateonly, date_format, sep, timings, errors,
+                                                 missing_status)
+        used_status[missing] = missing_status
+        if cache is not None:
+            cacheable = missing & ~np.isnat(parsed)
+            cache.update(used_values[cacheable], parsed[cacheable], settings)
+
+    value_dates = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+    value_dates[used_codes] = parsed
+    if status is not None:
+        value_status = np.full(len(values), _UNPARSED, dtype=np.int8)
+        value_status[used_codes] = used_status
+        status[:] = value_status.take(codes)
+    return value_dates.take(codes)
+
+
+def _parse_arrow_dates(date_col: pd.Series, dateonly: bool, date_format: str, sep: str, timings: dict = None,
+                       errors: str = 'raise', status: np.ndarray = None) -> np.ndarray:
+    '''
+    parses an Arrow-backed string column with Arrow compute kernels on its buffers
+
+    Suffix stripping, separator normalization and the strict parse of date_format and of year-first dates run as
+    utf8_length, replace_substring and strptime kernels. Arrow's strptime rolls invalid days over into the next month,
+    e.g. '02/31/2001' into 2001-03-03, so a parsed date only counts if its day matches the digits of the string. Only
+    the rows left over are converted to Python strings and parsed, and repaired, by _parse_date_values.
+
+    Arguments:
+    date_col: pandas series - column of dtype string[pyarrow] or ArrowDtype string.
+    dateonly, date_format, sep - as in parse_dates.
+    timings, errors, status - as in _parse_date_values.
+
+    Returns:
+    numpy array of dtype datetime64.
+    '''
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    end_stage = _StageTimer({} if timings is None else timings).end
+
+    # pa.array returns the buffers of the column without copying them, only columns of several chunks are combined
+    dates = pa.array(date_col.array)
+    if isinstance(dates, pa.ChunkedArray):
+        dates = dates.combine_chunks()
+    original = dates
+    if dateonly is True:
+        long_dates = pc.fill_null(pc.greater(pc.utf8_length(dates), 10), False)
+        if pc.any(long_dates).as_py():
+            stripped = pc.replace_substring_regex(dates.filter(long_dates), pattern=_TIME_SUFFIX.pattern, replacement='')
+            dates = pc.replace_with_mask(dates, long_dates, stripped)
+    end_stage('suffix_strip')
+    if sep in ['/', '-', '.']:
+        for other_sep in '/-.'.replace(sep, ''):
+            dates = pc.replace_substring(dates, pattern=other_sep, replacement=sep)
+    end_stage('separator_normalize')
+
+    # Year-first dates are only taken as they are by the layout stage of the object path, so they have to be year-first
+    # before their time is stripped, or ISO-8601 timestamps when only the date is kept. Without a separator to
+    # normalize them to, they are left to the object path
+    year_first = [rf'^\d{{4}}{re.escape(layout_sep)}\d{{2}}{re.escape(layout_sep)}\d{{2}}$' for layout_sep in '/-.']
+    if dateonly is True:
+        year_first.append(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$')
+    directives = [date_format[:2], date_format[2:4], date_format[4:6]]
+    layouts = [(directives, None)]
+    if directives != ['%Y', '%m', '%d'] and sep in ['/', '-', '.']:
+        layouts.append((['%Y', '%m', '%d'], '|'.join(year_first)))
+
+    parsed = pa.nulls(len(dates), pa.timestamp('ns'))
+    for layout_directives, original_pattern in layouts:
+        unresolved = pc.is_null(parsed)
+        if not pc.any(unresolved).as_py():
+            break
+        widths = [4 if directive == '%Y' else 2 for directive in layout_directives]
+        if original_pattern is None:
+            shape = re.escape(sep).join(rf'\d{{{width}}}' for width in widths)
+            candidates = pc.match_substring_regex(dates, pattern=f'^{shape}$')
+        else:
+            candidates = pc.match_substring_regex(original, pattern=original_pattern)
+        candidates = pc.fill_null(pc.and_(unresolved, candidates), False)
+        layout_dates = pc.strptime(pc.if_else(candidates, dates, None), format=sep.join(layout_directives), unit='ns',
+                                   error_is_null=True)
+        day_start = sum(widths[:layout_directives.index('%d')]) + len(sep) * layout_directives.index('%d')
+        day = pc.cast(pc.utf8_slice_codeunits(pc.if_else(candidates, dates, None), day_start, day_start + 2), pa.int64())
+        valid = pc.fill_null(pc.equal(pc.day(layout_dates), day), False)
+        parsed = pc.if_else(valid, layout_dates, parsed)
+    date_values = parsed.to_numpy(zero_copy_only=False).astype('datetime64[ns]')
+    if status is not None:
+        status[:] = _STRICT
+    end_stage('strict_parse')
+
+    # Everything else, including missing values, takes the object path with its layouts and repair
+    leftover = np.flatnonzero(np.isnat(date_values))
+    if len(leftover) > 0:
+        leftover_col = pd.Series(date_col.iloc[leftover].to_numpy(dtype=object, na_value=np.nan),
+                                 index=date_col.index[leftover], dtype=object)
+        leftover_status = None if status is None else np.empty(len(leftover), dtype=np.int8)
+        date_values[leftover] = _parse_date_values(leftover_col, dateonly, date_format, sep, timings, errors,
+                                                   leftover_status)
+        if status is not None:
+            status[leftover] = leftover_status
+    return date_values
+
+
+def _time_of_day(time_col: pd.Series, errors: str = 'raise') -> np.ndarray:
+    '''
+    converts a column of times like '13:44:18' or ISO-8601 timestamps like '1975-02-23T02:58:41.000Z' into time of day
+
+    Arguments:
+    time_col: pandas series - column of dtype object containing time strings.
+    errors: str - default value= 'raise'. if 'coerce', then times which can not be parsed are NaT instead.
+
+    Returns:
+    numpy array of dtype timedelta64.
+    Raises ValueError if any row is not in any of the specified time format and errors='raise'.
+    '''
+    # A day has at most 86400 distinct whole-second times, so only the distinct values are converted
+    codes, times = pd.factorize(time_col)
+    times = pd.Series(times, dtype=object)
+
+    # ISO rows carry their time, including milliseconds, at a fixed offset
+    iso_times = (times.str.len() == len(_ISO_SHAPE)).to_numpy()
+    if iso_times.any():
+        times[iso_times] = times[iso_times].str.slice(11, 23)
+    time_of_day = pd.to_timedelta(times, errors='coerce')
+    invalid = (time_of_day.isna() | (time_of_day < pd.Timedelta(0)) | (time_of_day >= pd.Timedelta(days=1))).to_numpy()
+    # Missing times have code -1 and pick the trailing True
+    invalid_rows = np.append(invalid, True)[codes]
+    if invalid_rows.any() and errors != 'coerce':
+        bad = np.flatnonzero(invalid_rows)[0]
+        raise ValueError(f'{time_col.iloc[bad]} at index {time_col.index[bad]} is not in any of the specified time format')
+    time_of_day = np.append(np.where(invalid, np.timedelta64('NaT'), time_of_day.to_numpy()),
+                            np.timedelta64('NaT')).astype('timedelta64[ns]')
+    return time_of_day[codes]
+
+
+class ParseReport:
+    '''
+    parse-quality report of one parse_dates call, returned with the result when parse_dates is called with report=True
+
+    Arguments:
+    date_obj_col: pandas series - the parsed column, used for the samples.
+    time_obj_col: pandas series - default value= None. Time column of the call, sampled with the dates if given.
+    status: numpy array - how every row was resolved, _STRICT, _REPAIRED, _UNPARSED or _CACHED.
+    timings: dict - seconds spent per stage.
+    max_samples: int - default value= 10. Maximum number of unparseable values kept in samples.
+
+    Attributes:
+    rows: int - number of rows.
+    strict: int - rows parsed by the layout or strict-format stages.
+    repaired: int - rows parsed only after rearranging them into date_format.
+    unparsed: int - rows left NaT, including missing values.
+    cached: int - rows whose value was taken from the DateCache.
+    timings: dict - seconds per stage of _STAGES, 'time_of_day' when a time column was given, and 'total'.
+    samples: list - (index label, position, value) of the first unparseable rows, value is a (date, time) tuple
+                    when a time column was given.
+    '''
+    def __init__(self, date_obj_col: pd.Series, status: np.ndarray, timings: dict, time_obj_col: pd.Series = None,
+                 max_samples: int = 10):
+        counts = np.bincount(status, minlength=4)
+        self.rows = len(status)
+        self.strict = int(counts[_STRICT])
+        self.repaired = int(counts[_REPAIRED])
+        self.unparsed = int(counts[_UNPARSED])
+        self.cached = int(counts[_CACHED])
+        self.timings = dict(timings)
+        positions = np.flatnonzero(status == _UNPARSED)[:max_samples]
+        values = date_obj_col.iloc[positions].to_numpy(dtype=object)
+        if time_obj_col is not None:
+            values = list(zip(values, time_obj_col.iloc[positions].to_numpy(dtype=object)))
+        self.samples = [(date_obj_col.index[position], int(position), value) for position, value in zip(positions, values)]
+
+    def __repr__(self):
+        return (f'ParseReport(rows={self.rows}, strict={self.strict}, repaired={self.repaired}, '
+                f'unparsed={self.unparsed}, cached={self.cached}, total={self.timings.get("total", 0.0):.3f}s)')
+
+    def as_dict(self) -> dict:
+        return {'rows': self.rows, 'strict': self.strict, 'repaired': self.repaired, 'unparsed': self.unparsed,
+                'cached': self.cached, 'timings': dict(self.timings), 'samples': list(self.samples)}
+
+
+def _is_arrow_string(date_col: pd.Series) -> bool:
+    if isinstance(date_col.dtype, pd.StringDtype):
+        return date_col.dtype.storage in ['pyarrow', 'pyarrow_numpy']
+    return isinstance(date_col.dtype, pd.ArrowDtype) and str(date_col.dtype.pyarrow_dtype) in ['string', 'large_string']
+
+
+def _is_string_categorical(date_col: pd.Series) -> bool:
+    return isinstance(date_col.dtype, pd.CategoricalDtype) and is_object_dtype(date_col.cat.categories)
+
+
+def parse_dates(date_obj_col: pd.core.series, dateonly: bool, date_format: str, sep='/', unique=False, cache=None,
+                workers=None, time_obj_col=None, report=False, metrics_hook=None):
+    '''
+    parses pandas object into uniform string format and converts into pandas datetime64 format
+
+    Arguments:
+    date_obj_col: pandas series - column of dtype object which need to be converted to datetime64. Arrow-backed string
+                                  columns, e.g. from pd.read_csv(..., dtype_backend='pyarrow'), are parsed with Arrow
+                                  compute kernels and only rows which need repairing are converted to Python strings.
+    dateonly: bool - if True, then pandas datetime64 object will be further parsed to return only date.
+                     if False, then time part will not be excluded in the final result.
+    date_format: str - can be '%m%d%y' or '%d%m%y' or '%y%m%d or '%m%d%Y' or '%d%m%Y' or '%Y%m%d'
+                  where 'Y' represents 4 digit year and 'y' represents 2 digit year.
+    sep: str - default value= '/'. Can be '-', '.'
+    unique: bool - default value= False. if True, then only the distinct values are parsed and mapped back to the rows.
+                   Categorical columns are always parsed through their categories.
+    cache: DateCache - default value= None. if given, e.g. date_cache, then distinct values already parsed by earlier
+                       calls are taken from the cache instead of being parsed again. Implies unique=True.
+    workers: int - default value= None. if greater than 1, then the column is split into partitions which are parsed
+                   by that many worker processes. Columns shorter than a few partitions and Arrow-backed columns are
+                   parsed in-process.
+    time_obj_col: pandas series - default value= None. Column of dtype object or Arrow-backed strings with the time of
+                                  every date, e.g. '13:44:18' or '1975-02-23T02:58:41.000Z'. if given, then the dates
+                                  are parsed as with dateonly=True, the time of day is added and the result is of dtype
+                                  datetime64[ns, UTC].
+    report: bool - default value= False. if True, then rows which can not be parsed are NaT instead of aborting the
+                   parse, and a ParseReport with the stage timings, row counts and samples of those rows is returned
+                   with the result.
+    metrics_hook: callable - default value= None. if given, then it is called with the ParseReport of every successful
+                             parse, e.g. to send report.timings to a metrics system.
+
+
+    Returns:
+    Only date component of pandas datetime64 if dateonly=True in the given format.
+    pandas series of dtype datetime64 if dateonly=False in the given format.
+    pandas series of dtype datetime64[ns, UTC] if time_obj_col is given.
+    tuple of the pandas series and its ParseReport if report=True.
+    '''
+    if time_obj_col is not None and not (type(time_obj_col)==pd.core.series.Series
+                                         and (is_object_dtype(time_obj_col) or _is_arrow_string(time_obj_col))
+                                         and len(time_obj_col) == len(date_obj_col)):
+        print('time_obj_col should be of type pandas.core.series.Series with the same length as date_obj_col')
+    elif type(date_obj_col)==pd.core.series.Series and (is_object_dtype(date_obj_col) or _is_arrow_string(date_obj_col)
+                                                        or _is_string_categorical(date_obj_col)):
+        try:
+            start = time.perf_counter()
+            errors = 'coerce' if report is True else 'raise'
+            timings = dict.fromkeys(_STAGES, 0.0)
+            status = np.empty(len(date_obj_col), dtype=np.int8)
+            if time_obj_col is not None:
+                dateonly = True
+            if unique is True or cache is not None or _is_string_categorical(date_obj_col):
+                date_values = _parse_unique_dates(date_obj_col, dateonly, date_format, sep, cache, workers, timings,
+                                                  errors, status)
+            elif _is_arrow_string(date_obj_col):
+                date_values = _parse_arrow_dates(date_obj_col, dateonly, date_format, sep, timings, errors, status)
+            elif workers is not None and workers > 1:
+                date_values = _parse_date_values_parallel(date_obj_col, dateonly, date_format, sep, workers, timings,
+                                                          errors, status)
+            else:
+                date_values = _parse_date_values(date_obj_col, dateonly, date_format, sep, timings, errors, status)
+            date_parsed = pd.Series(date_values, index=date_obj_col.index, name=date_obj_col.name)
+            if time_obj_col is not None:
+                time_start = time.perf_counter()
+                time_of_day = _time_of_day(time_obj_col, errors)
+                status[np.isnat(time_of_day)] = _UNPARSED
+                date_parsed = (date_parsed + time_of_day).dt.tz_localize('UTC')
+                timings['time_of_day'] = time.perf_counter() - time_start
+            timings['total'] = time.perf_counter() - start
+
+            if report is True or metrics_hook is not None:
+                parse_report = ParseReport(date_obj_col, status, timings, time_obj_col)
+                if metrics_hook is not None:
+                    metrics_hook(parse_report)
+                if report is True:
+                    return date_parsed, parse_report
+            return date_parsed
+        except ValueError as v:
+            print(v)
+    else:
+        print('date_obj_col should be of type pandas.core.series.Series')
@@ -0,0 +1,146 @@
+'''
+time-indexed store of parsed earthquake events: a sorted datetime64 index answers range, per-period and rolling-window
+queries with binary search instead of boolean masks over the whole catalogue.
+'''
+import numpy as np
+import pandas as pd
+
+# Frequencies of EventStore.counts_per mapped to the period starts of pd.date_range
+_PERIOD_STARTS = {'D': 'D', 'M': 'MS', 'Y': 'YS'}
+
+
+def timestamps_to_ns(values, tz=None) -> np.ndarray:
+    '''
+    converts timestamps like '1975-02-23' into int64 nanoseconds since the epoch in UTC
+
+    Arguments:
+    values: timestamp or array of timestamps.
+    tz: timezone - default value= None. Timezone naive timestamps are taken to be in, None for UTC.
+
+    Returns:
+    numpy array of dtype int64.
+    '''
+    index = pd.DatetimeIndex(np.atleast_1d(values))
+    if tz is not None and index.tz is None:
+        index = index.tz_localize(tz)
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+    return index.as_unit('ns').asi8
+
+
+class EventStore:
+    '''
+    keeps the events sorted by time together with a numpy array of their timestamps as int64 nanoseconds
+
+    Arguments:
+    events: pandas dataframe - parsed catalogue, e.g. load_catalogue() or the notebook frame with date_parsed.
+    time_col: str - default value= 'date_parsed'. Column of dtype datetime64 the events are indexed by.
+                    Rows where it is NaT are left out.
+    '''
+    def __init__(self, events: pd.DataFrame, time_col: str = 'date_parsed'):
+        self.time_col = time_col
+        self.tz = getattr(events[time_col].dtype, 'tz', None)
+        events = events[events[time_col].notna()]
+        times = self._event_times(events)
+        order = np.argsort(times, kind='stable')
+        self.events = events.iloc[order]
+        self.times = times[order]
+
+    def __len__(self):
+        return len(self.times)
+
+    def _event_times(self, events: pd.DataFrame) -> np.ndarray:
+        times = events[self.time_col]
+        if self.tz is not None:
+            times = times.dt.tz_convert('UTC').dt.tz_localize(None)
+        return times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+    def _bounds(self, start=None, end=None) -> tuple:
+        '''
+        returns the positions of the first event at or after start and the first event at or after end
+        '''
+        first, stop = 0, len(self.times)
+        if start is not None:
+            first = int(np.searchsorted(self.times, timestamps_to_ns(start, self.tz)[0], side='left'))
+        if end is not None:
+            stop = int(np.searchsorted(self.times, timestamps_to_ns(end, self.tz)[0], side='left'))
+        return first, max(first, stop)
+
+    def range(self, start=None, end=None) -> pd.DataFrame:
+        '''
+        returns the events with start <= time < end in O(log n + k)
+
+        Arguments:
+        start: timestamp - default value= None. Inclusive lower bound, None for the first event.
+        end: timestamp - default value= None. Exclusive upper bound, None for after the last event.
+
+        Returns:
+        pandas dataframe sorted by time.
+        '''
+        first, stop = self._bounds(start, end)
+        return self.events.iloc[first:stop]
+
+    def count(self, start=None, end=None) -> int:
+        '''
+        returns the number of events with start <= time < end in O(log n)
+        '''
+        first, stop = self._bounds(start, end)
+        return stop - first
+
+    def counts_per(self, freq: str = 'D', start=None, end=None) -> pd.Series:
+        '''
+        counts the events per day, month or year with one binary search per period boundary
+
+        Arguments:
+        freq: str - default value= 'D'. Can be 'M' or 'Y', or any pd.date_range frequency of period starts.
+        start: timestamp - default value= None. First period contains start, None for the first event.
+        end: timestamp - default value= None. Last period contains end, None for the last event.
+
+        Returns:
+        pandas series of event counts indexed by the start of every period.
+        '''
+        if len(self.times) == 0:
+            return pd.Series([], dtype=np.int64)
+        freq = _PERIOD_STARTS.get(freq, freq)
+        first = pd.Timestamp(self.times[0] if start is None else timestamps_to_ns(start, self.tz)[0])
+        last = pd.Timestamp(self.times[-1] if end is None else timestamps_to_ns(end, self.tz)[0])
+        offset = pd.tseries.frequencies.to_offset(freq)
+        edges = pd.date_range(offset.rollback(first.normalize()), last + offset, freq=freq)
+        positions = np.searchsorted(self.times, edges.as_unit('ns').asi8, side='left')
+        periods = edges[:-1] if self.tz is None else edges[:-1].tz_localize('UTC').tz_convert(self.tz)
+        return pd.Series(np.diff(positions), index=periods)
+
+    def rolling_counts(self, window, query_times=None) -> np.ndarray:
+        '''
+        counts the events in the window (t - window, t] for every query time t in O(log n) per query
+
+        Arguments:
+        window: timedelta - e.g. '7D' or pd.Timedelta(hours=1).
+        query_times: array of timestamps - default value= None. None counts the window ending at every event.
+
+        Returns:
+        numpy array of dtype int64.
+        '''
+        window = pd.Timedelta(window).as_unit('ns').value
+        ends = self.times if query_times is None else timestamps_to_ns(query_times, self.tz)
+        return np.searchsorted(self.times, ends, side='right') - np.searchsorted(self.times, ends - window, side='right')
+
+    def append(self, events: pd.DataFrame):
+        '''
+        adds newly ingested events and keeps the index sorted without re-sorting the stored events
+
+        Only the new events are sorted, they are then merged into the stored ones at the positions found by binary
+        search.
+
+        Arguments:
+        events: pandas dataframe - new events with the same columns, e.g. a chunk of ingest.iter_parsed_chunks.
+        '''
+        events = events[events[self.time_col].notna()]
+        times = self._event_times(events)
+        order = np.argsort(times, kind='stable')
+        events, times = events.iloc[order], times[order]
+
+        insert_at = np.searchsorted(self.times, times, side='right')
+        merged = np.insert(np.arange(len(self.times)), insert_at, len(self.times) + np.arange(len(times)))
+        self.events = pd.concat([self.events, events]).iloc[merged]
+        self.times = np.insert(self.times, insert_at, times)
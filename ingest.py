@@ -0,0 +1,87 @@
+'''
+streaming ingestion of the earthquake catalogue: the CSV is read in chunks and the date column of every chunk is parsed
+with parse_dates, so memory is bounded by the chunk size and not by the size of the file.
+
+Usage:
+python ingest.py data/database.csv earthquakes_parsed.csv --chunksize 100000
+'''
+import argparse
+import time
+
+import pandas as pd
+
+from date_parsing import parse_dates, date_cache
+
+
+def iter_parsed_chunks(path: str, chunksize: int = 100_000, date_col: str = 'Date', parsed_col: str = 'date_parsed',
+                       dateonly: bool = True, date_format: str = '%m%d%Y', sep: str = '/', cache=date_cache,
+                       **read_csv_kwargs):
+    '''
+    reads a CSV file in chunks and yields every chunk with its date column parsed
+
+    Arguments:
+    path: str - path of the CSV file, e.g. './data/database.csv'.
+    chunksize: int - default value= 100000. Number of rows read at once.
+    date_col: str - default value= 'Date'. Column which is parsed with parse_dates.
+    parsed_col: str - default value= 'date_parsed'. Column the parsed dates are stored in.
+    dateonly, date_format, sep - passed to parse_dates.
+    cache: DateCache - default value= date_cache. Passed to parse_dates so that dates repeated across chunks are
+                       parsed only once. None parses every chunk on its own.
+    read_csv_kwargs - further arguments of pd.read_csv, e.g. usecols.
+
+    Returns:
+    generator of pandas dataframes.
+    Raises ValueError if the date column of a chunk can not be parsed.
+    '''
+    dtype = {**read_csv_kwargs.pop('dtype', {}), date_col: object}
+    with pd.read_csv(path, chunksize=chunksize, dtype=dtype, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            date_parsed = parse_dates(chunk[date_col], dateonly=dateonly, date_format=date_format, sep=sep, cache=cache)
+            if date_parsed is None:
+                raise ValueError(f'{date_col} of the chunk starting at row {chunk.index[0]} could not be parsed')
+            chunk[parsed_col] = date_parsed
+            yield chunk
+
+
+def ingest_csv(path: str, output: str, chunksize: int = 100_000, **kwargs) -> int:
+    '''
+    streams a CSV file through iter_parsed_chunks and appends the parsed chunks to an output CSV file
+
+    Arguments:
+    path: str - path of the CSV file to read.
+    output: str - path of the CSV file to write, overwritten if it exists.
+    chunksize: int - default value= 100000. Number of rows read at once.
+    kwargs - further arguments of iter_parsed_chunks.
+
+    Returns:
+    int - number of rows written.
+    '''
+    rows = 0
+    for chunk in iter_parsed_chunks(path, chunksize=chunksize, **kwargs):
+        chunk.to_csv(output, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='CSV file to read')
+    parser.add_argument('output', help='CSV file to write')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--date-col', default='Date')
+    parser.add_argument('--parsed-col', default='date_parsed')
+    parser.add_argument('--date-format', default='%m%d%Y')
+    parser.add_argument('--sep', default='/')
+    parser.add_argument('--keep-time', action='store_true', help='parse with dateonly=False')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = ingest_csv(args.path, args.output, chunksize=args.chunksize, date_col=args.date_col,
+                      parsed_col=args.parsed_col, dateonly=not args.keep_time, date_format=args.date_format,
+                      sep=args.sep)
+    seconds = time.perf_counter() - start
+    print(f'{rows} rows written to {args.output} in {seconds:.2f} s ({rows / max(seconds, 1e-9):,.0f} rows/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+'''
+spatial grid index of the earthquake catalogue: events are bucketed into lat/lon grid cells stored as numpy offsets, so
+bounding-box and radius queries only look at the events of the cells they overlap.
+'''
+import math
+
+import numpy as np
+import pandas as pd
+
+from event_store import timestamps_to_ns
+
+# Mean earth radius used for haversine distances
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat: np.ndarray, lon: np.ndarray, center_lat: float, center_lon: float) -> np.ndarray:
+    '''
+    returns the great-circle distance in km of every point from the center
+
+    Arguments:
+    lat, lon: numpy arrays - coordinates in degrees.
+    center_lat, center_lon: float - coordinates of the center in degrees.
+
+    Returns:
+    numpy array of dtype float64.
+    '''
+    lat, lon = np.radians(lat), np.radians(lon)
+    center_lat, center_lon = np.radians(center_lat), np.radians(center_lon)
+    a = np.sin((lat - center_lat) / 2) ** 2 + np.cos(lat) * np.cos(center_lat) * np.sin((lon - center_lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+class SpatialIndex:
+    '''
+    lat/lon grid over the events: row positions sorted by grid cell plus the offset of every cell into them
+
+    Arguments:
+    latitude, longitude: array - coordinates of the events in degrees. Rows with a missing coordinate are not indexed.
+    cell_size: float - default value= 1.0. Width and height of a grid cell in degrees.
+    times: pandas series - default value= None. datetime64 column of the events, e.g. date_parsed, used by the start
+                           and end arguments of the queries.
+    '''
+    def __init__(self, latitude, longitude, cell_size: float = 1.0, times: pd.Series = None):
+        self.cell_size = cell_size
+        self.n_lat = int(np.ceil(180 / cell_size))
+        self.n_lon = int(np.ceil(360 / cell_size))
+        self.latitude = np.asarray(latitude, dtype=np.float64)
+        self.longitude = np.asarray(longitude, dtype=np.float64)
+
+        indexed = np.flatnonzero(~(np.isnan(self.latitude) | np.isnan(self.longitude)))
+        cells = self._lat_bin(self.latitude[indexed]) * self.n_lon + self._lon_bin(self.longitude[indexed])
+        order = np.argsort(cells, kind='stable')
+        self.positions = indexed[order]
+        self.offsets = np.zeros(self.n_lat * self.n_lon + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=self.n_lat * self.n_lon), out=self.offsets[1:])
+
+        self.tz = None
+        self.times = None
+        if times is not None:
+            self.tz = getattr(times.dtype, 'tz', None)
+            if self.tz is not None:
+                times = times.dt.tz_convert('UTC').dt.tz_localize(None)
+            self.times = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+    @classmethod
+    def from_frame(cls, events: pd.DataFrame, cell_size: float = 1.0, lat_col: str = 'Latitude',
+                   lon_col: str = 'Longitude', time_col: str = 'date_parsed') -> 'SpatialIndex':
+        '''
+        builds the index of a parsed catalogue, e.g. load_catalogue(), with the time column if it has one
+        '''
+        times = events[time_col] if time_col in events.columns else None
+        return cls(events[lat_col].to_numpy(), events[lon_col].to_numpy(), cell_size, times)
+
+    def _lat_bin(self, lat):
+        return np.clip(np.floor((np.asarray(lat) + 90) / self.cell_size).astype(np.int64), 0, self.n_lat - 1)
+
+    def _lon_bin(self, lon):
+        return np.clip(np.floor((np.asarray(lon) + 180) / self.cell_size).astype(np.int64), 0, self.n_lon - 1)
+
+    def _cell(self, value: float, lowest: float, cells: int) -> int:
+        # Scalar version of _lat_bin/_lon_bin, numpy calls dominate the cost of a query otherwise
+        return min(max(math.floor((value - lowest) / self.cell_size), 0), cells - 1)
+
+    def _candidates(self, min_lat: float, max_lat: float, lon_ranges: list) -> np.ndarray:
+        '''
+        returns the row positions of the events in the grid cells overlapping the box
+        '''
+        row_starts = np.arange(self._cell(min_lat, -90, self.n_lat), self._cell(max_lat, -90, self.n_lat) + 1) * self.n_lon
+        starts, stops = [], []
+        for min_lon, max_lon in lon_ranges:
+            starts.append(self.offsets[row_starts + self._cell(min_lon, -180, self.n_lon)])
+            stops.append(self.offsets[row_starts + self._cell(max_lon, -180, self.n_lon) + 1])
+        starts = starts[0] if len(starts) == 1 else np.concatenate(starts)
+        stops = stops[0] if len(stops) == 1 else np.concatenate(stops)
+
+        # Gathers positions[start:stop] of every cell row at once
+        lengths = stops - starts
+        if lengths.sum() == 0:
+            return np.empty(0, dtype=np.int64)
+        ends = np.cumsum(lengths)
+        candidates = self.positions[np.repeat(starts - (ends - lengths), lengths) + np.arange(ends[-1])]
+        if len(lon_ranges) > 1:
+            # Ranges split at the antimeridian may share their edge cells
+            return np.unique(candidates)
+        return candidates
+
+    def _filter_time(self, candidates: np.ndarray, start=None, end=None) -> np.ndarray:
+        if start is None and end is None:
+            return candidates
+        if self.times is None:
+            raise ValueError('start and end need an index built with times')
+        times = self.times[candidates]
+        keep = np.ones(len(candidates), dtype=bool)
+        if start is not None:
+            keep &= times >= timestamps_to_ns(start, self.tz)[0]
+        if end is not None:
+            keep &= times < timestamps_to_ns(end, self.tz)[0]
+        return candidates[keep]
+
+    def bbox(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float, start=None, end=None) -> np.ndarray:
+        '''
+        returns the row positions of the events inside a bounding box and optionally a time range
+
+        Arguments:
+        min_lat, max_lat: float - latitude bounds in degrees, inclusive.
+        min_lon, max_lon: float - longitude bounds in degrees, inclusive. min_lon > max_lon crosses the antimeridian.
+        start: timestamp - default value= None. Inclusive lower time bound.
+        end: timestamp - default value= None. Exclusive upper time bound.
+
+        Returns:
+        numpy array of sorted row positions, e.g. for events.iloc.
+        '''
+        lon_ranges = [(min_lon, max_lon)] if min_lon <= max_lon else [(min_lon, 180), (-180, max_lon)]
+        candidates = self._candidates(min_lat, max_lat, lon_ranges)
+        lat, lon = self.latitude[candidates], self.longitude[candidates]
+        inside = (lat >= min_lat) & (lat <= max_lat)
+        if min_lon <= max_lon:
+            inside &= (lon >= min_lon) & (lon <= max_lon)
+        else:
+            inside &= (lon >= min_lon) | (lon <= max_lon)
+        return np.sort(self._filter_time(candidates[inside], start, end))
+
+    def radius(self, lat: float, lon: float, radius_km: float, start=None, end=None) -> np.ndarray:
+        '''
+        returns the row positions of the events within radius_km of a point and optionally a time range
+
+        Only the cells of the bounding box of the circle are searched, their events are then filtered by haversine
+        distance.
+
+        Arguments:
+        lat, lon: float - center in degrees.
+        radius_km: float - radius in km.
+        start: timestamp - default value= None. Inclusive lower time bound.
+        end: timestamp - default value= None. Exclusive upper time bound.
+
+        Returns:
+        numpy array of sorted row positions, e.g. for events.iloc.
+        '''
+        delta_lat = np.degrees(radius_km / EARTH_RADIUS_KM)
+        min_lat, max_lat = lat - delta_lat, lat + delta_lat
+        if min_lat <= -90 or max_lat >= 90 or radius_km / EARTH_RADIUS_KM >= np.pi / 2:
+            lon_ranges = [(-180, 180)]
+        else:
+            delta_lon = np.degrees(np.arcsin(np.sin(radius_km / EARTH_RADIUS_KM) / np.cos(np.radians(lat))))
+            min_lon, max_lon = lon - delta_lon, lon + delta_lon
+            if min_lon < -180:
+                lon_ranges = [(min_lon + 360, 180), (-180, max_lon)]
+            elif max_lon > 180:
+                lon_ranges = [(min_lon, 180), (-180, max_lon - 360)]
+            else:
+                lon_ranges = [(min_lon, max_lon)]
+        candidates = self._candidates(max(min_lat, -90), min(max_lat, 90), lon_ranges)
+        distance = haversine_km(self.latitude[candidates], self.longitude[candidates], lat, lon)
+        return np.sort(self._filter_time(candidates[distance <= radius_km], start, end))
@@ -0,0 +1,65 @@
+'''
+checks that Arrow-backed string columns parse exactly like dtype object columns
+
+Usage:
+python -m pytest tests
+'''
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import parse_dates
+
+pa = pytest.importorskip('pyarrow')
+
+# Every layout parse_dates handles, rows which need repairing and rows which can not be parsed
+DATES = pd.Series([
+    '01/02/1965', '02/01/1965 10:00:00', '1965-01-02T01:02:03.000Z', '1965/01/02', '1965.01.02 01:02:03',
+    '1965-01-02', '23/02/1975', '01-02-1965', '01.02.1965', '01021965', '19650102', '010265', '01/02/65',
+    '65/01/02', '02/31/2001', '02/30/2001', '29/02/1992', '02/29/1900', 'zz', np.nan, '1/2/1965', '1/2/19650',
+    '01/02/1965 ', '13/01/1965 01:02:03 PM', '02/23/1975xyz', '1965/01-02', '02/01/1965 10:00',
+], index=[f'r{row}' for row in range(27)], dtype=object)
+
+ARROW_DTYPES = {'string[pyarrow]': 'string[pyarrow]', 'large_string': pd.ArrowDtype(pa.large_string())}
+
+
+@pytest.mark.parametrize('dtype', ARROW_DTYPES)
+@pytest.mark.parametrize('dateonly', [True, False])
+@pytest.mark.parametrize('sep', ['/', '-', '.', ''])
+@pytest.mark.parametrize('date_format', ['%m%d%Y', '%d%m%Y', '%Y%m%d', '%m%d%y', '%d%m%y', '%y%m%d'])
+def test_arrow_matches_object(date_format, sep, dateonly, dtype):
+    expected, expected_report = parse_dates(DATES, dateonly, date_format, sep=sep, report=True)
+    parsed, report = parse_dates(DATES.astype(ARROW_DTYPES[dtype]), dateonly, date_format, sep=sep, report=True)
+    assert parsed.dtype == expected.dtype
+    assert parsed.equals(expected)
+    assert (report.strict, report.repaired, report.unparsed) == \
+           (expected_report.strict, expected_report.repaired, expected_report.unparsed)
+    assert [sample[:2] for sample in report.samples] == [sample[:2] for sample in expected_report.samples]
+
+
+@pytest.mark.parametrize('sep', ['/', ''])
+def test_year_first_without_separator(sep):
+    dates = pd.Series(['01021965', '1965/01/02', '1965-01-02T01:02:03.000Z'])
+    expected = parse_dates(dates.astype(object), True, '%m%d%Y', sep=sep)
+    parsed = parse_dates(dates.astype('string[pyarrow]'), True, '%m%d%Y', sep=sep)
+    assert parsed.tolist() == expected.tolist() == [pd.Timestamp('1965-01-02')] * 3
+
+
+@pytest.mark.parametrize('value', ['02/31/2001', '02/30/2001', '02/29/1900', '04/31/2001'])
+def test_days_do_not_roll_over(value):
+    # Arrow's strptime alone turns '02/31/2001' into 2001-03-03
+    parsed, report = parse_dates(pd.Series([value], dtype='string[pyarrow]'), True, '%m%d%Y', report=True)
+    assert parsed.isna().all()
+    assert (report.strict, report.unparsed) == (0, 1)
+
+
+def test_arrow_time_column():
+    dates = pd.Series(['01/02/1965', '1975-02-23T02:58:41.000Z'], dtype='string[pyarrow]')
+    times = pd.Series(['13:44:18', '1975-02-23T02:58:41.000Z'], dtype='string[pyarrow]')
+    parsed = parse_dates(dates, True, '%m%d%Y', time_obj_col=times)
+    assert parsed.tolist() == [pd.Timestamp('1965-01-02 13:44:18', tz='UTC'),
+                               pd.Timestamp('1975-02-23 02:58:41', tz='UTC')]
@@ -0,0 +1,45 @@
+'''
+checks of the Parquet sidecar of load_catalogue
+
+Usage:
+python -m pytest tests
+'''
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import catalogue
+
+pytest.importorskip('pyarrow')
+
+DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'database.csv')
+
+
+def test_touch_records_new_mtime(tmp_path, monkeypatch):
+    path = str(tmp_path / 'database.csv')
+    shutil.copyfile(DATABASE, path)
+    first = catalogue.load_catalogue(path)
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = catalogue.load_catalogue(path)
+    assert touched.equals(first)
+
+    # The touch is recorded, so the next load neither hashes nor parses the CSV file
+    monkeypatch.setattr(catalogue, '_file_hash', lambda path: pytest.fail('CSV file hashed again'))
+    monkeypatch.setattr(catalogue, 'read_catalogue_csv', lambda path: pytest.fail('CSV file parsed again'))
+    assert catalogue.load_catalogue(path).equals(first)
+
+
+def test_changed_csv_rebuilds_sidecar(tmp_path):
+    path = str(tmp_path / 'database.csv')
+    with open(DATABASE) as source, open(path, 'w') as target:
+        target.writelines(line for _, line in zip(range(101), source))
+    assert len(catalogue.load_catalogue(path)) == 100
+
+    with open(DATABASE) as source, open(path, 'w') as target:
+        target.writelines(line for _, line in zip(range(51), source))
+    assert len(catalogue.load_catalogue(path)) == 50
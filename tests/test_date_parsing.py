@@ -0,0 +1,120 @@
+'''
+regression checks of the NaT repair in parse_dates
+
+Usage:
+python -m pytest tests
+'''
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from date_parsing import DateCache, ParseReport, parse_dates
+
+
+def _parse(values, dateonly=True, date_format='%m%d%Y', **kwargs):
+    return parse_dates(pd.Series(values, dtype=object), dateonly=dateonly, date_format=date_format, **kwargs)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('15/04/1989', '1989-04-15'),
+    ('23/02/1975', '1975-02-23'),
+    ('15-04-1989', '1989-04-15'),
+    ('1989/04/15', '1989-04-15'),
+])
+def test_day_first_four_digit_years(value, expected):
+    assert _parse([value]).tolist() == [pd.Timestamp(expected)]
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('01/02/1965', '1965-01-02'),
+    ('1965/01/02', '1965-01-02'),
+    ('23/02/1975', '1975-02-23'),
+    ('01/02/65', '2065-01-02'),
+    ('23-02-2015', '2015-02-23'),
+])
+def test_two_digit_target_format_keeps_four_digit_years(value, expected):
+    assert _parse([value], date_format='%m%d%y').tolist() == [pd.Timestamp(expected)]
+
+
+@pytest.mark.parametrize('value', ['02/23/1975xyz', '02/23/1975/07', '1975/02/23abc', '02/30/2001', '2001/02/30'])
+def test_unrepairable_dates(value, capsys):
+    assert _parse([value]) is None
+    assert f'{value} at index 0 is not in any of the specified datetime format' in capsys.readouterr().out
+
+    parsed, report = _parse([value], report=True)
+    assert parsed.isna().all()
+    assert (report.repaired, report.unparsed) == (0, 1)
+
+
+def test_time_is_not_truncated(capsys):
+    assert _parse(['02/23/1975 10:00'], dateonly=False) is None
+    assert 'is not in any of the specified datetime format' in capsys.readouterr().out
+
+
+# Two strict month-first rows, an ISO-8601 row, a repaired day-first row and three unparseable rows
+MIXED = pd.Series(['01/02/1965', '1965-01-02T01:02:03.000Z', '23/02/1975', 'zz', np.nan, '02/30/2001', '01/02/1965'],
+                  index=list('abcdefg'), dtype=object)
+MIXED_DATES = [pd.Timestamp('1965-01-02'), pd.Timestamp('1965-01-02'), pd.Timestamp('1975-02-23'), pd.NaT, pd.NaT,
+               pd.NaT, pd.Timestamp('1965-01-02')]
+MIXED_SAMPLES = [('d', 3, 'zz'), ('e', 4, np.nan), ('f', 5, '02/30/2001')]
+
+
+def _assert_samples(samples, expected):
+    assert [(label, position) for label, position, _ in samples] == [(label, position) for label, position, _ in expected]
+    assert pd.Series([value for _, _, value in samples], dtype=object).equals(
+        pd.Series([value for _, _, value in expected], dtype=object))
+
+
+@pytest.mark.parametrize('unique', [False, True])
+def test_report_counts_and_samples(unique):
+    parsed, report = parse_dates(MIXED, dateonly=True, date_format='%m%d%Y', unique=unique, report=True)
+    assert parsed.tolist() == MIXED_DATES
+    assert parsed.index.equals(MIXED.index)
+    assert isinstance(report, ParseReport)
+    assert (report.rows, report.strict, report.repaired, report.unparsed, report.cached) == (7, 3, 1, 3, 0)
+    _assert_samples(report.samples, MIXED_SAMPLES)
+    assert report.timings['total'] >= sum(report.timings[stage] for stage in report.timings if stage != 'total')
+    assert report.as_dict()['unparsed'] == 3
+
+
+def test_report_counts_cached_rows():
+    cache = DateCache()
+    parse_dates(MIXED, dateonly=True, date_format='%m%d%Y', cache=cache, report=True)
+    parsed, report = parse_dates(MIXED, dateonly=True, date_format='%m%d%Y', cache=cache, report=True)
+    assert parsed.tolist() == MIXED_DATES
+    # Unparseable values are not cached and are parsed again
+    assert (report.strict, report.repaired, report.unparsed, report.cached) == (0, 0, 3, 4)
+    _assert_samples(report.samples, MIXED_SAMPLES)
+
+
+def test_report_samples_time_column():
+    times = pd.Series(['13:44:18', 'xx', '01:00:00', '00:00:00'], dtype=object)
+    dates = pd.Series(['01/02/1965', '01/03/1965', 'zz', '01/04/1965'], dtype=object)
+    parsed, report = parse_dates(dates, dateonly=True, date_format='%m%d%Y', time_obj_col=times, report=True)
+    assert parsed.isna().tolist() == [False, True, True, False]
+    assert report.unparsed == 2
+    assert report.samples == [(1, 1, ('01/03/1965', 'xx')), (2, 2, ('zz', '01:00:00'))]
+    assert 'time_of_day' in report.timings
+
+
+def test_metrics_hook():
+    reports = []
+    parsed = parse_dates(MIXED.iloc[:3], dateonly=True, date_format='%m%d%Y', metrics_hook=reports.append)
+    # Without report=True the result is returned alone and the hook still gets the report
+    assert isinstance(parsed, pd.Series)
+    assert len(reports) == 1
+    assert (reports[0].strict, reports[0].repaired, reports[0].unparsed) == (2, 1, 0)
+
+    parsed, report = parse_dates(MIXED, dateonly=True, date_format='%m%d%Y', report=True, metrics_hook=reports.append)
+    assert reports[-1] is report
+
+
+def test_metrics_hook_not_called_on_error(capsys):
+    reports = []
+    assert parse_dates(MIXED, dateonly=True, date_format='%m%d%Y', metrics_hook=reports.append) is None
+    assert 'zz at index d is not in any of the specified datetime format' in capsys.readouterr().out
+    assert reports == []
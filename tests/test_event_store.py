@@ -0,0 +1,60 @@
+'''
+checks of EventStore against a full rebuild and brute-force masks
+
+Usage:
+python -m pytest tests
+'''
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from event_store import EventStore
+
+
+def _events(rows, seed, tz=None):
+    rng = np.random.default_rng(seed)
+    # Whole days only, so that many events share their time
+    days = rng.integers(0, 400, size=rows)
+    times = pd.Series(pd.Timestamp('2011-01-01') + pd.to_timedelta(days, unit='D'))
+    times[rng.random(rows) < 0.05] = pd.NaT
+    if tz is not None:
+        times = times.dt.tz_localize(tz)
+    return pd.DataFrame({'date_parsed': times, 'ID': [f'{seed}-{row}' for row in range(rows)]})
+
+
+@pytest.mark.parametrize('tz', [None, 'UTC'])
+def test_append_matches_rebuild(tz):
+    chunks = [_events(500, seed, tz) for seed in range(4)]
+    store = EventStore(chunks[0])
+    for chunk in chunks[1:]:
+        store.append(chunk)
+
+    rebuilt = EventStore(pd.concat(chunks))
+    assert np.array_equal(store.times, rebuilt.times)
+    assert store.events.equals(rebuilt.events)
+    assert len(store) == sum(chunk['date_parsed'].notna().sum() for chunk in chunks)
+
+
+def test_queries_match_masks():
+    events = _events(2000, 7)
+    store = EventStore(events)
+    times = events['date_parsed']
+
+    start, end = pd.Timestamp('2011-03-11'), pd.Timestamp('2011-07-01')
+    inside = (times >= start) & (times < end)
+    assert store.count(start, end) == inside.sum()
+    assert sorted(store.range(start, end)['ID']) == sorted(events.loc[inside, 'ID'])
+
+    query_times = pd.date_range('2011-01-01', '2012-03-01', freq='13D')
+    window = pd.Timedelta('7D')
+    expected = [((times > query - window) & (times <= query)).sum() for query in query_times]
+    assert store.rolling_counts(window, query_times).tolist() == expected
+
+    per_month = store.counts_per('M')
+    assert per_month.sum() == times.notna().sum()
+    assert per_month.to_dict() == times.dropna().dt.to_period('M').dt.start_time.value_counts().reindex(
+        per_month.index, fill_value=0).to_dict()
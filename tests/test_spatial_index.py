@@ -0,0 +1,74 @@
+'''
+checks of SpatialIndex queries against brute-force masks over all events
+
+Usage:
+python -m pytest tests
+'''
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from spatial_index import SpatialIndex, haversine_km
+
+
+def _points(seed=0):
+    rng = np.random.default_rng(seed)
+    lat = np.concatenate([rng.uniform(-90, 90, 3000), rng.uniform(85, 90, 300), rng.uniform(-90, -85, 300),
+                          rng.uniform(-90, 90, 300), [90, -90, 0, 0, np.nan, 10]])
+    lon = np.concatenate([rng.uniform(-180, 180, 3000), rng.uniform(-180, 180, 600),
+                          rng.uniform(175, 180, 150), rng.uniform(-180, -175, 150), [0, 0, 180, -180, 10, np.nan]])
+    return lat, lon
+
+
+@pytest.mark.parametrize('cell_size', [1.0, 5.0, 0.7])
+@pytest.mark.parametrize('min_lat, max_lat, min_lon, max_lon', [
+    (-10, 10, -20, 20),
+    (-30, 30, 170, -170),
+    (-90, 90, 179.5, -179.5),
+    (80, 90, -180, 180),
+    (-90, -80, 100, -100),
+    (0, 0, 180, -180),
+    # Both halves of a box wrapping almost around the globe share their edge cells
+    (-20, 20, -176, -177),
+    (-20, 20, 177.5, 177.2),
+])
+def test_bbox_matches_mask(cell_size, min_lat, max_lat, min_lon, max_lon):
+    lat, lon = _points()
+    index = SpatialIndex(lat, lon, cell_size)
+    inside = (lat >= min_lat) & (lat <= max_lat)
+    if min_lon <= max_lon:
+        inside &= (lon >= min_lon) & (lon <= max_lon)
+    else:
+        inside &= (lon >= min_lon) | (lon <= max_lon)
+    assert index.bbox(min_lat, max_lat, min_lon, max_lon).tolist() == np.flatnonzero(inside).tolist()
+
+
+@pytest.mark.parametrize('cell_size', [1.0, 5.0, 0.7])
+@pytest.mark.parametrize('center_lat, center_lon, radius_km', [
+    (0, 179.8, 500),
+    (0, -179.8, 500),
+    (60, 178, 1500),
+    (89.5, 0, 300),
+    (-89.9, 120, 2000),
+    (45, -100, 15000),
+    (0, 0, 21000),
+])
+def test_radius_matches_mask(cell_size, center_lat, center_lon, radius_km):
+    lat, lon = _points()
+    index = SpatialIndex(lat, lon, cell_size)
+    inside = haversine_km(lat, lon, center_lat, center_lon) <= radius_km
+    assert index.radius(center_lat, center_lon, radius_km).tolist() == np.flatnonzero(inside).tolist()
+
+
+def test_time_bounds_match_mask():
+    lat, lon = _points()
+    times = pd.Series(pd.Timestamp('2011-01-01') + pd.to_timedelta(np.arange(len(lat)), unit='h')).dt.tz_localize('UTC')
+    index = SpatialIndex(lat, lon, 2.0, times)
+    start, end = pd.Timestamp('2011-02-01', tz='UTC'), pd.Timestamp('2011-04-01', tz='UTC')
+    inside = (lat >= -30) & (lat <= 30) & ((lon >= 170) | (lon <= -170)) & (times >= start).to_numpy() & \
+             (times < end).to_numpy()
+    assert index.bbox(-30, 30, 170, -170, start, end).tolist() == np.flatnonzero(inside).tolist()